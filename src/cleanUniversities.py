@@ -1,51 +1,39 @@
 #!/usr/bin/env python3
 import argparse
 import csv
+import re
 from pathlib import Path
+from typing import Tuple
+
+try:
+    import pyarrow as pa
+    import pyarrow.compute as pc
+    import pyarrow.csv as pacsv
+except ImportError:
+    pa = pc = pacsv = None
 
 TARGET_COUNTRY = "United States"
 
+# no spaces, contains a dot, doesn't start or end with one
+_DOMAIN_PATTERN = r"[^ .][^ ]*\.[^ ]*[^ .]"
+_DOMAIN_RE = re.compile(_DOMAIN_PATTERN)
+
 def norm(s: str) -> str:
     return (s or "").strip()
 
-def norm_lower(s: str) -> str:
-    return norm(s).lower()
-
-def norm_domain(d: str) -> str:
-    d = norm(d).lower()
-    if d.startswith("@"):
+def clean_domain(d: str) -> str:
+    # strip + lower in one pass each, then drop one leading "@" and trailing dots
+    d = (d or "").strip().lower()
+    if d[:1] == "@":
         d = d[1:]
-    while d.endswith("."):
-        d = d[:-1]
-    return d
+    return d.rstrip(".")
 
 def is_valid_domain(d: str) -> bool:
-    if not d:
-        return False
-    if " " in d:
-        return False
-    if "." not in d:
-        return False
-    if d.startswith(".") or d.endswith("."):
-        return False
-    return True
-
-def main():
-    ap = argparse.ArgumentParser(description="Clean university domains CSV.")
-    ap.add_argument("--in", dest="inp", required=True, help="Input CSV path")
-    ap.add_argument("--out", dest="out", required=True, help="Output CSV path")
-    ap.add_argument("--country", default=TARGET_COUNTRY, help="Country filter (default: United States)")
-    ap.add_argument("--dedupe", action="store_true", help="Deduplicate rows by (name,country,domain)")
-    args = ap.parse_args()
-
-    target_country = norm_lower(args.country)
-
-    in_path = Path(args.inp)
-    out_path = Path(args.out)
-
-    if not in_path.exists():
-        raise FileNotFoundError(f"Input not found: {in_path}")
+    return bool(d) and _DOMAIN_RE.fullmatch(d) is not None
 
+def clean_csv(in_path: Path, out_path: Path, target_country: str,
+              dedupe: bool) -> Tuple[int, int, int]:
+    """Row-at-a-time cleaner. Returns (kept, filtered_country, dropped)."""
     seen = set()
     kept = 0
     dropped = 0
@@ -54,44 +42,162 @@ def main():
     with in_path.open("r", newline="", encoding="utf-8-sig") as fin, \
          out_path.open("w", newline="", encoding="utf-8") as fout:
 
-        reader = csv.DictReader(fin)
+        reader = csv.reader(fin)
+        header = next(reader, [])
+        idx = {h.strip(): i for i, h in enumerate(header)}
+        missing = {"name", "country", "domain"} - idx.keys()
+        if missing:
+            raise ValueError(f"Missing required columns: {sorted(missing)}")
+        i_name, i_country, i_domain = idx["name"], idx["country"], idx["domain"]
+        width = max(i_name, i_country, i_domain) + 1
 
-        writer = csv.DictWriter(
-            fout,
-            fieldnames=["name", "country", "domain", "email_example"],
-        )
-        writer.writeheader()
+        writer = csv.writer(fout)
+        writer.writerow(["name", "country", "domain", "email_example"])
+
+        # bound once so the loop below skips the attribute lookups per row
+        writerow = writer.writerow
+        fullmatch = _DOMAIN_RE.fullmatch
+        seen_add = seen.add
 
         for row in reader:
-            name = norm(row.get("name"))
-            country = norm(row.get("country"))
-            domain = norm_domain(row.get("domain"))
+            if not row:
+                continue
+            if len(row) < width:
+                dropped += 1
+                continue
+
+            name = row[i_name].strip()
+            country = row[i_country].strip()
+            domain = clean_domain(row[i_domain])
 
-            # country filter
-            if norm_lower(country) != target_country:
+            # country filter (country is already stripped, target already lowered)
+            if country.lower() != target_country:
                 filtered_country += 1
                 continue
 
-            if not name or not is_valid_domain(domain):
+            # same check as is_valid_domain; the pattern never matches ""
+            if not name or fullmatch(domain) is None:
                 dropped += 1
                 continue
 
-            key = domain if args.dedupe else None
-
-            if args.dedupe:
-                if key in seen:
+            if dedupe:
+                if domain in seen:
                     dropped += 1
                     continue
-                seen.add(key)
-
-            writer.writerow({
-                "name": name,
-                "country": country,
-                "domain": domain,
-                "email_example": f"abc@{domain}",
-            })
+                seen_add(domain)
+
+            writerow((name, country, domain, "abc@" + domain))
             kept += 1
 
+    return kept, filtered_country, dropped
+
+def clean_arrow(in_path: Path, out_path: Path, target_country: str,
+                dedupe: bool) -> Tuple[int, int, int]:
+    """
+    Same rules as clean_csv, run as Arrow compute kernels over whole columns.
+    Returns (kept, filtered_country, dropped).
+    """
+    # match columns by stripped header name, like clean_csv does
+    with in_path.open("r", newline="", encoding="utf-8-sig") as fin:
+        header = next(csv.reader(fin), [])
+    raw = {h.strip(): h for h in header}
+    missing = {"name", "country", "domain"} - raw.keys()
+    if missing:
+        raise ValueError(f"Missing required columns: {sorted(missing)}")
+    cols = [raw["name"], raw["country"], raw["domain"]]
+
+    short_rows = 0
+    long_rows = False
+
+    def check_row(row) -> str:
+        nonlocal short_rows, long_rows
+        if row.actual_columns < row.expected_columns:
+            short_rows += 1
+            return "skip"
+        # clean_csv keeps rows with extra fields; Arrow can't, so bail out
+        long_rows = True
+        return "error"
+
+    try:
+        t = pacsv.read_csv(
+            in_path,
+            parse_options=pacsv.ParseOptions(invalid_row_handler=check_row),
+            convert_options=pacsv.ConvertOptions(
+                include_columns=cols,
+                column_types={c: pa.string() for c in cols},
+            ),
+        )
+    except pa.ArrowInvalid:
+        if not long_rows:
+            raise
+        return clean_csv(in_path, out_path, target_country, dedupe)
+    t = t.rename_columns(["name", "country", "domain"])
+
+    name = pc.utf8_trim_whitespace(t["name"])
+    country = pc.utf8_trim_whitespace(t["country"])
+    domain = pc.utf8_lower(pc.utf8_trim_whitespace(t["domain"]))
+    domain = pc.replace_substring_regex(domain, pattern="^@", replacement="")
+    domain = pc.utf8_rtrim(domain, characters=".")
+
+    country_mask = pc.equal(pc.utf8_lower(country), target_country)
+    valid = pc.and_(
+        pc.greater(pc.utf8_length(name), 0),
+        pc.match_substring_regex(domain, f"^{_DOMAIN_PATTERN}$"),
+    )
+
+    out = pa.table({"name": name, "country": country, "domain": domain})
+    out = out.filter(pc.and_(country_mask, valid))
+
+    if dedupe:
+        # keep the first row per domain, in input order
+        out = out.append_column("_row", pa.array(range(out.num_rows), pa.int64()))
+        first = out.group_by("domain", use_threads=False).aggregate([("_row", "min")])["_row_min"]
+        out = out.take(pc.take(first, pc.sort_indices(first))).drop_columns(["_row"])
+
+    out = out.append_column(
+        "email_example",
+        pc.binary_join_element_wise("abc@", out["domain"], ""),
+    )
+    # pacsv.write_csv quotes every string, so go through csv.writer to keep
+    # the output byte-identical to clean_csv's
+    with out_path.open("w", newline="", encoding="utf-8") as fout:
+        writer = csv.writer(fout)
+        writer.writerow(out.column_names)
+        writer.writerows(zip(*(col.to_pylist() for col in out.columns)))
+
+    in_country = pc.sum(country_mask).as_py() or 0
+    kept = out.num_rows
+    return kept, t.num_rows - in_country, short_rows + in_country - kept
+
+def process(in_path: Path, out_path: Path, country: str = TARGET_COUNTRY,
+            dedupe: bool = False, use_arrow: bool = True) -> Tuple[int, int, int]:
+    """
+    Clean in_path into out_path, keeping rows for `country`.
+    Uses the Arrow cleaner when pyarrow is available and use_arrow is set,
+    otherwise the row-at-a-time one. Returns (kept, filtered_country, dropped).
+    """
+    if not in_path.exists():
+        raise FileNotFoundError(f"Input not found: {in_path}")
+
+    target_country = norm(country).lower()
+    if pacsv is None or not use_arrow:
+        return clean_csv(in_path, out_path, target_country, dedupe)
+    return clean_arrow(in_path, out_path, target_country, dedupe)
+
+def main():
+    ap = argparse.ArgumentParser(description="Clean university domains CSV.")
+    ap.add_argument("--in", dest="inp", required=True, help="Input CSV path")
+    ap.add_argument("--out", dest="out", required=True, help="Output CSV path")
+    ap.add_argument("--country", default=TARGET_COUNTRY, help="Country filter (default: United States)")
+    ap.add_argument("--dedupe", action="store_true", help="Deduplicate rows by (name,country,domain)")
+    ap.add_argument("--no-arrow", action="store_true", help="Use the pure-Python cleaner even if pyarrow is installed")
+    args = ap.parse_args()
+
+    out_path = Path(args.out)
+    kept, filtered_country, dropped = process(
+        Path(args.inp), out_path, args.country, args.dedupe, use_arrow=not args.no_arrow,
+    )
+
     print(f"Done.")
     print(f"Kept: {kept}")
     print(f"Filtered (non-US): {filtered_country}")
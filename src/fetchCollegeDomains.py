@@ -1,10 +1,21 @@
 #!/usr/bin/env python3
 import argparse
 import csv
-import json
+import itertools
 import sys
 from pathlib import Path
+from typing import Iterable, Iterator, Optional
 from urllib.request import urlopen, Request
+
+try:
+    import orjson as _json
+except ImportError:
+    import json as _json
+
+try:
+    import ijson
+except ImportError:
+    ijson = None
 # What
 
 HIPO_RAW_JSON = (
@@ -17,73 +28,129 @@ def fetch_json(url: str) -> list[dict]:
     with urlopen(req, timeout=30) as resp:
         if resp.status != 200:
             raise RuntimeError(f"HTTP {resp.status} fetching {url}")
-        data = resp.read().decode("utf-8")
-    return json.loads(data)
+        # both orjson and json accept the raw bytes, no .decode() needed
+        return _json.loads(resp.read())
+
+def iter_universities(url: str) -> Iterator[dict]:
+    """
+    Stream university records one at a time instead of loading the whole
+    dump into memory. Falls back to fetch_json when ijson is not installed.
+    """
+    if ijson is None:
+        yield from fetch_json(url)
+        return
+    req = Request(url, headers={"User-Agent": "data/test-01"})
+    with urlopen(req, timeout=30) as resp:
+        if resp.status != 200:
+            raise RuntimeError(f"HTTP {resp.status} fetching {url}")
+        yield from ijson.items(resp, "item")
 
 def normalize(s):
     return (s or "").strip()
 
+def iter_rows(records: Iterable[dict], countries: Optional[frozenset],
+              ci_country: bool, one_row_per_school: bool) -> Iterator[tuple]:
+    """
+    Turn university records into output CSV rows, keeping only those whose
+    country is in `countries` (lowercased first when ci_country is set).
+    """
+    for r in records:
+        name = normalize(r.get("name"))
+        country = normalize(r.get("country"))
+        alpha_two_code = normalize(r.get("alpha_two_code"))
+        state_province = normalize(r.get("state-province"))
+
+        if countries is not None and (country.lower() if ci_country else country) not in countries:
+            continue
+
+        domains = r.get("domains") or []
+        web_pages = r.get("web_pages") or []
+
+        if one_row_per_school:
+            yield (
+                name,
+                country,
+                alpha_two_code,
+                state_province,
+                ";".join(domains),
+                ";".join(web_pages),
+            )
+        else:
+            web_page_example = web_pages[0] if web_pages else ""
+            for d in domains:
+                d = normalize(d)
+                if not d:
+                    continue
+                yield (
+                    name,
+                    country,
+                    alpha_two_code,
+                    state_province,
+                    d,
+                    f"abc@{d}",
+                    web_page_example,
+                )
+
+def quote(s: str) -> str:
+    return '"' + s.replace('"', '""') + '"'
+
+def fast_csv_lines(rows: Iterable[tuple]) -> Iterator[str]:
+    """
+    Hand-rolled CSV for the per-domain layout. Free-text fields are always
+    quoted; alpha_two_code, domain and email are written raw since Hipo keeps
+    them free of commas and quotes. Line endings match csv.writer's.
+    """
+    for name, country, alpha_two_code, state_province, domain, email, web_page in rows:
+        yield (f"{quote(name)},{quote(country)},{alpha_two_code},{quote(state_province)},"
+               f"{domain},{email},{quote(web_page)}\r\n")
+
 def main():
     ap = argparse.ArgumentParser(
         description="Download university name + domains and export to CSV."
     )
     ap.add_argument("--out", default="data/universities_domains.csv", help="Output CSV path")
-    ap.add_argument("--country", default=None, help="Optional country filter (case-insensitive exact match)")
+    ap.add_argument("--country", default=None,
+                    help="Optional country filter, exact match on Hipo's spelling (e.g. 'United States')")
+    ap.add_argument("--ci-country", action="store_true", help="Match --country case-insensitively")
     ap.add_argument("--one-row-per-school", action="store_true",
                     help="If set, keep domains joined in one cell instead of expanding rows.")
+    ap.add_argument("--fast-csv", action="store_true",
+                    help="Per-domain layout only: write rows with a hand-rolled quoter instead of the csv module.")
     args = ap.parse_args()
 
-    rows = fetch_json(HIPO_RAW_JSON)
-
-    country_filter = args.country.lower().strip() if args.country else None
+    # Hipo country names are already canonical, so an exact set lookup is
+    # enough unless --ci-country asks for case folding
+    countries = None
+    if args.country:
+        wanted = args.country.strip()
+        countries = frozenset([wanted.lower() if args.ci_country else wanted])
     out_path = Path(args.out)
 
-    with out_path.open("w", newline="", encoding="utf-8") as f:
-        w = csv.writer(f)
-        if args.one_row_per_school:
-            w.writerow(["name", "country", "alpha_two_code", "state_province", "domains", "web_pages"])
-        else:
-            w.writerow(["name", "country", "alpha_two_code", "state_province", "domain", "email_example", "web_page_example"])
-
-        count = 0
-        for r in rows:
-            name = normalize(r.get("name"))
-            country = normalize(r.get("country"))
-            alpha_two_code = normalize(r.get("alpha_two_code"))
-            state_province = normalize(r.get("state-province"))
-
-            if country_filter and country.lower() != country_filter:
-                continue
-
-            domains = r.get("domains") or []
-            web_pages = r.get("web_pages") or []
-
+    # records are streamed while writing, so write to a temp file and only
+    # replace the existing output once the whole download succeeded
+    tmp_path = out_path.with_name(out_path.name + ".tmp")
+    try:
+        with tmp_path.open("w", newline="", encoding="utf-8") as f:
+            w = csv.writer(f)
             if args.one_row_per_school:
-                w.writerow([
-                    name,
-                    country,
-                    alpha_two_code,
-                    state_province,
-                    ";".join(domains),
-                    ";".join(web_pages),
-                ])
-                count += 1
+                w.writerow(["name", "country", "alpha_two_code", "state_province", "domains", "web_pages"])
+            else:
+                w.writerow(["name", "country", "alpha_two_code", "state_province", "domain", "email_example", "web_page_example"])
+
+            # zip pulls from the rows first, so the counter is only advanced for
+            # rows that were actually written; next() then yields the total
+            counter = itertools.count()
+            rows = iter_rows(iter_universities(HIPO_RAW_JSON), countries, args.ci_country, args.one_row_per_school)
+            counted = (row for row, _ in zip(rows, counter))
+            if args.fast_csv and not args.one_row_per_school:
+                f.writelines(fast_csv_lines(counted))
             else:
-                web_page_example = web_pages[0] if web_pages else ""
-                for d in domains:
-                    d = normalize(d)
-                    if not d:
-                        continue
-                    w.writerow([
-                        name,
-                        country,
-                        alpha_two_code,
-                        state_province,
-                        d,
-                        f"abc@{d}",
-                        web_page_example,
-                    ])
-                    count += 1
+                w.writerows(counted)
+            count = next(counter)
+    except BaseException:
+        tmp_path.unlink(missing_ok=True)
+        raise
+    tmp_path.replace(out_path)
 
     print(f"Wrote {count} row(s) to {out_path.resolve()}")
 
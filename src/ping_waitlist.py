@@ -1,14 +1,29 @@
 #!/usr/bin/env python3
 import argparse
+import asyncio
 import csv
-import json
-import random
+import re
+import sqlite3
+import sys
 import time
+import zlib
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime, timezone
+from functools import lru_cache
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Tuple
 
-import requests
+import httpx
+
+try:
+    import orjson as _json
+except ImportError:
+    import json as _json
+
+try:
+    import jmespath
+except ImportError:
+    jmespath = None
 
 TRPC_URL = "https://trydatedrop.com/api/trpc/waitlist.signup?batch=1"
 
@@ -23,6 +38,30 @@ DEFAULT_HEADERS = {
     "user-agent": "waitlist-tester/1.0 (+python requests)",
 }
 
+# tRPC batch body, split around the email so it can be built by concatenation
+_BODY_PREFIX = b'{"0":{"json":{"email":"'
+_BODY_SUFFIX = b'"}}}'
+# printable ASCII except '"' and '\\', i.e. needs no JSON escaping
+_PLAIN_EMAIL_RE = re.compile(r'[\x20\x21\x23-\x5b\x5d-\x7e]*')
+
+# One input row: (name, country, domain, email_example)
+Row = Tuple[str, str, str, str]
+
+OUT_HEADER = [
+    "timestamp_utc",
+    "name",
+    "country",
+    "domain",
+    "email_used",
+    "waitlist_position",
+    "http_status",
+    "raw_response",
+]
+
+# Results are buffered in memory; flush the output (and commit --state-db)
+# every this many rows
+FLUSH_EVERY = 100
+
 # Keys we will look for when trying to find the waitlist position
 CANDIDATE_KEYS = [
     "position",
@@ -35,6 +74,20 @@ CANDIDATE_KEYS = [
     "place",
     "number",
 ]
+_CANDIDATE_KEYS_LOWER = frozenset(k.lower() for k in CANDIDATE_KEYS)
+
+_DIGIT_RE = re.compile(r"\d+")
+
+# Known tRPC response shapes, tried before the generic deep_find_position walk.
+# [][] flattens both a jsonl list of envelopes and a single batched array.
+_POSITION_EXPR = jmespath.compile(
+    "[][].json.data.position"
+    " || [][].json.data.waitlistPosition"
+    " || [][].result.data.json.position"
+) if jmespath is not None else None
+
+# How often the known-shape lookup hit vs fell back, to learn the real shape
+POSITION_STATS = {"fast": 0, "fallback": 0}
 
 def norm(s: str) -> str:
     return (s or "").strip()
@@ -47,28 +100,61 @@ def load_already_processed(out_csv: Path) -> set:
         return set()
     done = set()
     with out_csv.open("r", newline="", encoding="utf-8-sig") as f:
-        r = csv.DictReader(f)
+        r = csv.reader(f)
+        header = [h.strip() for h in next(r, [])]
+        if "domain" not in header:
+            return done
+        i_domain = header.index("domain")
         for row in r:
-            d = norm(row.get("domain", ""))
+            if len(row) <= i_domain:
+                continue
+            d = norm(row[i_domain])
             if d:
                 done.add(d.lower())
     return done
 
-def ensure_out_header(out_csv: Path):
-    if out_csv.exists():
-        return
-    with out_csv.open("w", newline="", encoding="utf-8") as f:
-        w = csv.writer(f)
-        w.writerow([
-            "timestamp_utc",
-            "name",
-            "country",
-            "domain",
-            "email_used",
-            "waitlist_position",
-            "http_status",
-            "raw_response",
-        ])
+class TokenBucket:
+    """
+    Async token bucket: lets up to `capacity` requests through back to back,
+    while holding the long-run average to `rate` requests per second.
+    """
+
+    def __init__(self, rate: float, capacity: float):
+        self.rate = rate
+        self.capacity = capacity
+        self.tokens = capacity
+        self.last = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    async def acquire(self):
+        # the lock makes waiters queue up in order instead of racing for tokens
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                self.tokens = min(self.capacity, self.tokens + (now - self.last) * self.rate)
+                self.last = now
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+                await asyncio.sleep((1 - self.tokens) / self.rate)
+
+def open_state_db(path: Path, out_csv: Path) -> sqlite3.Connection:
+    """
+    Side table of domains already written to the output, so resuming a long
+    run doesn't have to rescan the whole output CSV. A new (empty) table is
+    seeded once from out_csv, so results from runs without --state-db count.
+    """
+    conn = sqlite3.connect(path)
+    conn.execute("PRAGMA journal_mode=WAL")
+    conn.execute("CREATE TABLE IF NOT EXISTS done(domain TEXT PRIMARY KEY)")
+    if conn.execute("SELECT 1 FROM done LIMIT 1").fetchone() is None:
+        conn.executemany("INSERT OR IGNORE INTO done(domain) VALUES (?)",
+                         ((d,) for d in load_already_processed(out_csv)))
+        conn.commit()
+    return conn
+
+def is_done(conn: sqlite3.Connection, domain: str) -> bool:
+    return conn.execute("SELECT 1 FROM done WHERE domain=?", (domain,)).fetchone() is not None
 
 def parse_jsonl(text: str) -> List[Any]:
     """
@@ -82,8 +168,9 @@ def parse_jsonl(text: str) -> List[Any]:
     # If it looks like a single JSON value
     if text[0] in "[{":
         try:
-            return [json.loads(text)]
-        except json.JSONDecodeError:
+            return [_json.loads(text)]
+        except ValueError:
+            # json.JSONDecodeError and orjson.JSONDecodeError both subclass ValueError
             pass
 
     out = []
@@ -91,203 +178,385 @@ def parse_jsonl(text: str) -> List[Any]:
         line = line.strip()
         if not line:
             continue
-        out.append(json.loads(line))
+        out.append(_json.loads(line))
     return out
 
+# Replies at or under this size (errors, "already on the list", ...) tend to
+# repeat verbatim, so their parse is memoized
+PARSE_CACHE_MAX_LEN = 4096
+
+_parse_jsonl_cached = lru_cache(maxsize=128)(parse_jsonl)
+
+def parse_response(text: str) -> List[Any]:
+    """
+    parse_jsonl, memoized for small bodies. The result may be shared between
+    calls, so callers must not mutate it.
+    """
+    if len(text) <= PARSE_CACHE_MAX_LEN:
+        return _parse_jsonl_cached(text)
+    return parse_jsonl(text)
+
 def deep_find_position(obj: Any) -> Optional[int]:
     """
-    Recursively search for a plausible waitlist position in a JSON structure.
+    Search for a plausible waitlist position in a JSON structure.
     Prefers values under known keys, but will also accept lone ints if they
     look like a position (positive, not absurdly huge).
+    Walks depth-first with an explicit stack, visiting nodes in the same
+    order a recursive walk would.
     """
-    if obj is None:
-        return None
-
-    if isinstance(obj, bool):
-        return None
-
-    if isinstance(obj, int):
-        # heuristic: plausible waitlist position
-        if 1 <= obj <= 1_000_000:
-            return obj
-        return None
-
-    if isinstance(obj, float):
-        if obj.is_integer():
-            v = int(obj)
-            if 1 <= v <= 1_000_000:
-                return v
-        return None
-
-    if isinstance(obj, str):
-        # sometimes "You are #123" style strings exist
-        # extract first integer group if present
-        digits = []
-        current = ""
-        for ch in obj:
-            if ch.isdigit():
-                current += ch
-            else:
-                if current:
-                    digits.append(current)
-                    current = ""
-        if current:
-            digits.append(current)
-
-        for d in digits:
-            try:
-                v = int(d)
+    stack = [obj]
+    while stack:
+        node = stack.pop()
+
+        if node is None or isinstance(node, bool):
+            continue
+
+        if isinstance(node, int):
+            # heuristic: plausible waitlist position
+            if 1 <= node <= 1_000_000:
+                return node
+            continue
+
+        if isinstance(node, float):
+            if node.is_integer():
+                v = int(node)
                 if 1 <= v <= 1_000_000:
                     return v
-            except ValueError:
-                pass
-        return None
-
-    if isinstance(obj, list):
-        # try each element
-        for item in obj:
-            v = deep_find_position(item)
-            if v is not None:
-                return v
-        return None
-
-    if isinstance(obj, dict):
-        # first pass: check candidate keys directly
-        for k in list(obj.keys()):
-            lk = str(k)
-            if lk in CANDIDATE_KEYS:
-                v = deep_find_position(obj[k])
-                if v is not None:
-                    return v
-            # also match case-insensitively
-            if lk.lower() in [x.lower() for x in CANDIDATE_KEYS]:
-                v = deep_find_position(obj[k])
-                if v is not None:
+            continue
+
+        if isinstance(node, str):
+            # sometimes "You are #123" style strings exist
+            # take the first digit run that looks like a position
+            for m in _DIGIT_RE.finditer(node):
+                v = int(m.group())
+                if 1 <= v <= 1_000_000:
                     return v
+            continue
 
-        # second pass: recurse all values
-        for v0 in obj.values():
-            v = deep_find_position(v0)
-            if v is not None:
-                return v
+        if isinstance(node, list):
+            # reversed so the first element is popped first
+            stack.extend(reversed(node))
+            continue
+
+        if isinstance(node, dict):
+            # all values go on first, then the candidate keys on top so
+            # they are tried before the rest
+            stack.extend(reversed(list(node.values())))
+            stack.extend(reversed([v for k, v in node.items() if str(k).lower() in _CANDIDATE_KEYS_LOWER]))
 
     return None
 
-def build_payload(email: str) -> Dict[str, Any]:
-    # matches your captured request exactly
-    return {"0": {"json": {"email": email}}}
+def error_text(kind: str, e: Exception) -> str:
+    # serialized properly so quotes/newlines in the message stay valid JSON;
+    # httpx exceptions often have an empty message, so fall back to the type
+    text = _json.dumps({"error": kind, "detail": str(e) or type(e).__name__})
+    return text.decode("utf-8") if isinstance(text, bytes) else text
 
-def call_waitlist(session: requests.Session, email: str, timeout_s: int) -> Tuple[int, str]:
-    payload = build_payload(email)
-    r = session.post(TRPC_URL, headers=DEFAULT_HEADERS, json=payload, timeout=timeout_s)
+def find_position(parsed: List[Any]) -> Optional[int]:
+    """
+    Look for the position at the known tRPC paths first, falling back to the
+    generic deep_find_position walk if they don't hold a plausible value.
+    """
+    if _POSITION_EXPR is not None:
+        hits = _POSITION_EXPR.search(parsed)
+        v = hits[0] if hits else None
+        if isinstance(v, int) and not isinstance(v, bool) and 1 <= v <= 1_000_000:
+            POSITION_STATS["fast"] += 1
+            return v
+        POSITION_STATS["fallback"] += 1
+    return deep_find_position(parsed)
+
+def build_body(email: str) -> bytes:
+    # matches your captured request exactly: {"0":{"json":{"email":...}}}
+    if _PLAIN_EMAIL_RE.fullmatch(email):
+        # nothing to escape, so splice it straight into the template
+        return _BODY_PREFIX + email.encode("ascii") + _BODY_SUFFIX
+    body = _json.dumps({"0": {"json": {"email": email}}})
+    return body if isinstance(body, bytes) else body.encode("utf-8")
+
+async def call_waitlist(client: httpx.AsyncClient, email: str, timeout_s: int) -> Tuple[int, str]:
+    # headers live on the client; httpx fills in content-length from the bytes
+    r = await client.post(TRPC_URL, content=build_body(email), timeout=timeout_s)
     return r.status_code, r.text
 
-def append_result(out_csv: Path, row: Dict[str, str], email_used: str,
-                  position: Optional[int], http_status: int, raw_response: str):
-    with out_csv.open("a", newline="", encoding="utf-8") as f:
-        w = csv.writer(f)
-        w.writerow([
-            now_utc_iso(),
-            row["name"],
-            row["country"],
-            row["domain"],
-            email_used,
-            "" if position is None else position,
-            http_status,
-            raw_response,
-        ])
-
-def main():
-    ap = argparse.ArgumentParser(description="Ping waitlist endpoint for a list of university email domains.")
-    ap.add_argument("--in", dest="inp", required=True, help="Input CSV: name,country,domain,email_example")
-    ap.add_argument("--out", dest="out", default="waitlist_results_2.csv", help="Output CSV path")
-    ap.add_argument("--timeout", type=int, default=15, help="HTTP timeout seconds")
-    ap.add_argument("--min-sleep", type=float, default=0.4, help="Min delay between requests")
-    ap.add_argument("--max-sleep", type=float, default=1.2, help="Max delay between requests")
-    ap.add_argument("--retries", type=int, default=2, help="Retries on transient errors")
-    args = ap.parse_args()
+async def process_row(client: httpx.AsyncClient, sem: asyncio.Semaphore,
+                      limiter: Optional[TokenBucket], row: Row, args) -> Tuple[Row, Optional[int], int, str, bool]:
+    """
+    Ping the waitlist for one row. Any network error or timeout (failed
+    connects included) is retried here, up to --retries times with a growing
+    pause; every attempt takes its own rate-limiter token.
+    Returns (row, position, http_status, raw_response, ok).
+    """
+    email_used = row[3]
 
-    in_csv = Path(args.inp)
-    out_csv = Path(args.out)
+    status = 0
+    text = ""
+    position = None
+    ok = False
 
-    if not in_csv.exists():
-        raise FileNotFoundError(f"Input not found: {in_csv}")
+    async with sem:
+        for attempt in range(args.retries + 1):
+            if limiter is not None:
+                await limiter.acquire()
 
-    ensure_out_header(out_csv)
-    already = load_already_processed(out_csv)
-
-    session = requests.Session()
+            try:
+                status, text = await call_waitlist(client, email_used, args.timeout)
+
+                parsed = parse_response(text)
+                position = find_position(parsed)
+                ok = True
+                break
+
+            except (httpx.TimeoutException, httpx.NetworkError, httpx.RemoteProtocolError) as e:
+                text = error_text("network", e)
+                status = 0
+                if attempt < args.retries:
+                    await asyncio.sleep(0.6 + attempt)
+
+            except Exception as e:
+                text = error_text("exception", e)
+                status = 0
+                break
+
+    return row, position, status, text, ok
+
+def write_result(w, row: Row, position: Optional[int], http_status: int, raw_response: str):
+    name, country, domain, email_used = row
+    w.writerow((
+        now_utc_iso(),
+        name,
+        country,
+        domain,
+        email_used,
+        "" if position is None else position,
+        http_status,
+        raw_response,
+    ))
+
+def load_pending(in_csv: Path, out_csv: Path,
+                 db: Optional[sqlite3.Connection]) -> Tuple[List[Row], int]:
+    """
+    Read the input and drop rows that are invalid or already done.
+    Returns (rows to ping, skipped count).
+    """
+    # with a state db this only holds domains seen during this run
+    already = set() if db is not None else load_already_processed(out_csv)
 
-    kept = 0
     skipped = 0
-    failed = 0
-
+    rows: List[Row] = []
     with in_csv.open("r", newline="", encoding="utf-8-sig") as f:
-        reader = csv.DictReader(f)
+        reader = csv.reader(f)
+        header = next(reader, [])
+        idx = {h.strip(): i for i, h in enumerate(header)}
         required = {"name", "country", "domain", "email_example"}
-        missing = required - set((c or "").strip() for c in (reader.fieldnames or []))
+        missing = required - idx.keys()
         if missing:
             raise ValueError(f"Missing required columns: {sorted(missing)}")
+        i_name, i_country = idx["name"], idx["country"]
+        i_domain, i_email = idx["domain"], idx["email_example"]
+        width = max(idx[c] for c in required) + 1
 
         for row0 in reader:
-            row = {
-                "name": norm(row0.get("name", "")),
-                "country": norm(row0.get("country", "")),
-                "domain": norm(row0.get("domain", "")).lower(),
-                "email_example": norm(row0.get("email_example", "")),
-            }
-
-            if not row["domain"] or not row["email_example"]:
-                skipped += 1
+            if not row0:
                 continue
-
-            if row["domain"] in already:
+            if len(row0) < width:
                 skipped += 1
                 continue
 
-            email_used = row["email_example"]
-
-            # retry loop
-            last_status = 0
-            last_text = ""
-            position = None
-            ok = False
+            name = norm(row0[i_name])
+            country = norm(row0[i_country])
+            domain = norm(row0[i_domain]).lower()
+            email = norm(row0[i_email])
 
-            for attempt in range(args.retries + 1):
-                try:
-                    status, text = call_waitlist(session, email_used, args.timeout)
-                    last_status, last_text = status, text
-
-                    parsed = parse_jsonl(text)
-                    position = deep_find_position(parsed)
-                    ok = True
-                    break
+            if not domain or not email:
+                skipped += 1
+                continue
 
-                except (requests.Timeout, requests.ConnectionError) as e:
-                    last_text = f'{{"error":"network","detail":"{str(e)}"}}'
-                    last_status = 0
-                    time.sleep(0.6 + attempt)
+            if domain in already or (db is not None and is_done(db, domain)):
+                skipped += 1
+                continue
 
-                except Exception as e:
-                    last_text = f'{{"error":"exception","detail":"{str(e)}"}}'
-                    last_status = 0
-                    break
+            # mark at schedule time so duplicate domains in the input are only pinged once
+            already.add(domain)
+            # nearly every row shares the same country, so keep one copy of it
+            rows.append((name, sys.intern(country), domain, email))
 
-            append_result(out_csv, row, email_used, position, last_status, last_text)
+    return rows, skipped
 
-            if ok:
-                kept += 1
-            else:
-                failed += 1
+async def ping_rows(rows: List[Row], out_csv: Path, args,
+                    db: Optional[sqlite3.Connection]) -> Tuple[int, int]:
+    """
+    Ping every row and append the results to out_csv (and db, if given).
+    Returns (kept, failed).
+    """
+    kept = 0
+    failed = 0
 
-            already.add(row["domain"])
-            time.sleep(random.uniform(args.min_sleep, args.max_sleep))
+    sem = asyncio.Semaphore(args.concurrency)
+    limiter = TokenBucket(args.rate, max(1.0, args.rate)) if args.rate > 0 else None
+    # one pooled transport keeps the TLS connection alive across requests;
+    # retries=0 because process_row owns all retrying (and rate limiting)
+    transport = httpx.AsyncHTTPTransport(
+        http2=True,
+        limits=httpx.Limits(max_connections=32, max_keepalive_connections=32),
+        retries=0,
+    )
+
+    write_header = not out_csv.exists() or out_csv.stat().st_size == 0
+    fout = out_csv.open("a", newline="", encoding="utf-8", buffering=1 << 16)
+    w = csv.writer(fout)
+    if write_header:
+        w.writerow(OUT_HEADER)
+
+    try:
+        async with httpx.AsyncClient(transport=transport, headers=DEFAULT_HEADERS) as client:
+            tasks = [asyncio.create_task(process_row(client, sem, limiter, row, args)) for row in rows]
+
+            # results are written from this single coroutine as they complete,
+            # so the csv rows never interleave
+            for fut in asyncio.as_completed(tasks):
+                row, position, status, text, ok = await fut
+                write_result(w, row, position, status, text)
+
+                if ok:
+                    kept += 1
+                else:
+                    failed += 1
+
+                if db is not None:
+                    db.execute("INSERT OR IGNORE INTO done(domain) VALUES (?)", (row[2],))
+
+                if (kept + failed) % FLUSH_EVERY == 0:
+                    # csv first, so the db never marks a row that isn't on disk
+                    fout.flush()
+                    if db is not None:
+                        db.commit()
+    finally:
+        # also reached on Ctrl-C, so buffered rows aren't lost
+        fout.close()
+        if db is not None:
+            db.commit()
+
+    return kept, failed
+
+def shard_path(out_csv: Path, i: int) -> Path:
+    return out_csv.with_name(f"{out_csv.stem}.part{i}{out_csv.suffix}")
+
+def leftover_shards(out_csv: Path) -> List[Path]:
+    """Part files an interrupted --workers run never merged (any shard count)."""
+    return sorted(out_csv.parent.glob(f"{out_csv.stem}.part*{out_csv.suffix}"))
+
+def run_shard(rows: List[Row], part_csv: Path, args) -> Tuple[int, int, Dict[str, int]]:
+    """Worker process entry point: ping one shard into its own part file."""
+    # pool processes are reused across shards, so only report this shard's counts
+    for key in POSITION_STATS:
+        POSITION_STATS[key] = 0
+    kept, failed = asyncio.run(ping_rows(rows, part_csv, args, None))
+    return kept, failed, dict(POSITION_STATS)
+
+def merge_shards(parts: List[Path], out_csv: Path, db: Optional[sqlite3.Connection]):
+    """Append each part file's rows to out_csv (marking them in db), then delete it."""
+    write_header = not out_csv.exists() or out_csv.stat().st_size == 0
+    with out_csv.open("a", newline="", encoding="utf-8", buffering=1 << 16) as fout:
+        w = csv.writer(fout)
+        if write_header:
+            w.writerow(OUT_HEADER)
+        i_domain = OUT_HEADER.index("domain")
+        for part in parts:
+            if not part.exists():
+                continue
+            with part.open("r", newline="", encoding="utf-8") as fin:
+                r = csv.reader(fin)
+                next(r, None)
+                for row in r:
+                    # a crashed run can leave a half-written last line
+                    if len(row) < len(OUT_HEADER):
+                        continue
+                    w.writerow(row)
+                    if db is not None:
+                        db.execute("INSERT OR IGNORE INTO done(domain) VALUES (?)", (row[i_domain],))
+        fout.flush()
+        if db is not None:
+            db.commit()
+    for part in parts:
+        part.unlink(missing_ok=True)
+
+def run(args, in_csv: Path, out_csv: Path):
+    db = open_state_db(Path(args.state_db), out_csv) if args.state_db else None
+
+    try:
+        # fold in results from a run that died before merging, so those
+        # domains count as done instead of being pinged again
+        leftovers = leftover_shards(out_csv)
+        if leftovers:
+            print(f"Merging {len(leftovers)} leftover part file(s) into {out_csv}")
+            merge_shards(leftovers, out_csv, db)
+
+        rows, skipped = load_pending(in_csv, out_csv, db)
+
+        if args.workers <= 1:
+            kept, failed = asyncio.run(ping_rows(rows, out_csv, args, db))
+        else:
+            k = args.workers
+            # stable across runs (unlike hash()), so a domain always lands in
+            # the same shard
+            shards: List[List[Row]] = [[] for _ in range(k)]
+            for row in rows:
+                shards[zlib.crc32(row[2].encode("utf-8")) % k].append(row)
+
+            # --rate is the total budget, so each worker gets its share
+            shard_args = argparse.Namespace(**vars(args))
+            shard_args.rate = args.rate / k
+
+            parts = [shard_path(out_csv, i) for i in range(k)]
+            kept = failed = 0
+            try:
+                with ProcessPoolExecutor(max_workers=k) as pool:
+                    futures = [pool.submit(run_shard, shard, part, shard_args)
+                               for shard, part in zip(shards, parts)]
+                    for fut in futures:
+                        k_kept, k_failed, stats = fut.result()
+                        kept += k_kept
+                        failed += k_failed
+                        for key, n in stats.items():
+                            POSITION_STATS[key] += n
+            finally:
+                # merge whatever the workers wrote, even if one of them died
+                merge_shards(parts, out_csv, db)
+    finally:
+        if db is not None:
+            db.close()
 
     print("Done.")
     print(f"Processed: {kept}")
     print(f"Skipped: {skipped}")
     print(f"Failed: {failed}")
+    if _POSITION_EXPR is not None:
+        print(f"Position lookups (known shape / fallback): {POSITION_STATS['fast']} / {POSITION_STATS['fallback']}")
     print(f"Output: {out_csv.resolve()}")
 
+def main():
+    ap = argparse.ArgumentParser(description="Ping waitlist endpoint for a list of university email domains.")
+    ap.add_argument("--in", dest="inp", required=True, help="Input CSV: name,country,domain,email_example")
+    ap.add_argument("--out", dest="out", default="waitlist_results_2.csv", help="Output CSV path")
+    ap.add_argument("--timeout", type=int, default=15, help="HTTP timeout seconds")
+    ap.add_argument("--concurrency", type=int, default=8, help="Max requests in flight at once (per worker)")
+    ap.add_argument("--rate", type=float, default=1.25,
+                    help="Average requests per second across all workers (0 = unlimited)")
+    ap.add_argument("--retries", type=int, default=2, help="Retries on network errors and timeouts")
+    ap.add_argument("--state-db", default=None,
+                    help="Optional SQLite file tracking finished domains (instead of rescanning --out on start)")
+    ap.add_argument("--workers", type=int, default=1,
+                    help="Worker processes, each pinging a shard of the domains into its own part file")
+    args = ap.parse_args()
+
+    in_csv = Path(args.inp)
+    out_csv = Path(args.out)
+
+    if not in_csv.exists():
+        raise FileNotFoundError(f"Input not found: {in_csv}")
+
+    run(args, in_csv, out_csv)
+
 if __name__ == "__main__":
     main()